@@ -8,12 +8,13 @@ allowing users to view, edit, create, and delete text expansion snippets.
 
 # Standard library imports
 import os
+import re
 import sys
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 
 # Third-party imports
 import yaml
-from PyQt6.QtCore import Qt, QSettings, QUrl
+from PyQt6.QtCore import Qt, QSettings, QUrl, QStringListModel, QTimer
 from PyQt6.QtGui import QBrush, QColor, QKeySequence, QShortcut, QIcon, QDesktopServices
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QTableWidget, QTableWidgetItem,
@@ -23,7 +24,7 @@ from PyQt6.QtWidgets import (
 )
 
 # Local imports
-from yaml_handler import create_yaml_handler
+from yaml_handler import PYYAML_DUMPER, create_yaml_handler, write_text_atomic
 from styles import (
     BUTTON_STYLE, PRIMARY_BUTTON_STYLE, INPUT_STYLE, LABEL_STYLE, 
     INFO_LABEL_STYLE, INFO_LABEL_MULTILINE_STYLE, ABOUT_LABEL_STYLE,
@@ -37,8 +38,22 @@ FileData = Dict[str, List[Dict[str, Any]]]  # file_path -> list of match diction
 # Constants
 APP_VERSION = "1.2.1"
 MAX_UNDO_STEPS = 50
+FILTER_DELAY_MS = 80  # Idle time after the last keystroke before the table is filtered
 DEFAULT_WINDOW_SIZE = (600, 800)
 ICON_FILENAME = "icon_512x512.png"
+SIMPLE_MATCH_KEYS = frozenset({'trigger', 'replace'})  # Matches with any other key are read-only
+
+# Platform is fixed for the life of the process; shortcut strings for button labels follow it
+IS_MACOS = sys.platform == 'darwin'
+if IS_MACOS:
+    SHORTCUT_LABELS = {'open': "⌘O", 'new': "⌘N", 'save': "⌘S", 'find': "⌘F", 'refresh': "⌘R"}
+else:  # Windows/Linux/Unix
+    SHORTCUT_LABELS = {'open': "Ctrl+O", 'new': "Ctrl+N", 'save': "Ctrl+S", 'find': "Ctrl+F", 'refresh': "F5"}
+
+# Escaping between stored values and their single-line display form
+DISPLAY_ESCAPES = str.maketrans({'\\': '\\\\', '\n': '\\n', '\t': '\\t'})
+ESCAPE_SEQUENCES = {'\\\\': '\\', '\\n': '\n', '\\t': '\t'}
+ESCAPE_SEQUENCE_PATTERN = re.compile(r'\\\\|\\n|\\t')
 
 
 class EZpanso(QMainWindow):
@@ -47,6 +62,13 @@ class EZpanso(QMainWindow):
     A PyQt6-based GUI application for managing Espanso text expansion snippets.
     Provides functionality to view, edit, create, and delete snippets from YAML files.
     """
+    # Shared background for complex (read-only) rows; QBrush is implicitly shared by Qt
+    COMPLEX_MATCH_BRUSH = QBrush(QColor(180, 180, 180))
+    # Default QTableWidgetItem flags without ItemIsEditable, set directly instead of read-modify-write
+    COMPLEX_MATCH_FLAGS = (Qt.ItemFlag.ItemIsSelectable | Qt.ItemFlag.ItemIsDragEnabled |
+                           Qt.ItemFlag.ItemIsDropEnabled | Qt.ItemFlag.ItemIsUserCheckable |
+                           Qt.ItemFlag.ItemIsEnabled)
+    
     def __init__(self):
         """Initialize the EZpanso application.
         
@@ -61,7 +83,8 @@ class EZpanso(QMainWindow):
     
     def _initialize_window(self) -> None:
         """Initialize basic window properties."""
-        self.setWindowTitle(f"EZpanso v{APP_VERSION}")
+        self._window_title = f"EZpanso v{APP_VERSION}"  # Last title set, to skip no-op updates
+        self.setWindowTitle(self._window_title)
         self.resize(*DEFAULT_WINDOW_SIZE)
         
         # Initialize style constants as instance attributes
@@ -69,20 +92,32 @@ class EZpanso(QMainWindow):
         self.primary_button_style = PRIMARY_BUTTON_STYLE
         self.input_style = INPUT_STYLE
         
-        # Set window icon if available
+        # Dialogs are built on first use and reused afterwards
+        self._new_snippet_dialog: Optional[Tuple[QDialog, QLineEdit, QLineEdit]] = None
+        self._preferences_dialog: Optional[Tuple[QDialog, QLineEdit]] = None
+        
+        # Set window icon if available, reusing the application icon from main() so the PNG is loaded once
         self.app_icon = None
-        icon_path = os.path.join(os.path.dirname(__file__), ICON_FILENAME)
-        if os.path.exists(icon_path):
-            try:
-                self.app_icon = QIcon(icon_path)
-                self.setWindowIcon(self.app_icon)
-            except Exception as e:
-                print(f"Warning: Could not load application icon: {e}")
+        app = QApplication.instance()
+        shared_icon = app.windowIcon() if app else None
+        if shared_icon is not None and not shared_icon.isNull():
+            self.app_icon = shared_icon
+            self.setWindowIcon(self.app_icon)
+        else:
+            icon_path = os.path.join(os.path.dirname(__file__), ICON_FILENAME)
+            if os.path.exists(icon_path):
+                try:
+                    self.app_icon = QIcon(icon_path)
+                    self.setWindowIcon(self.app_icon)
+                except Exception as e:
+                    print(f"Warning: Could not load application icon: {e}")
     
     def _initialize_settings(self) -> None:
         """Initialize application settings and persistence."""
         self.settings = QSettings("EZpanso", "EZpanso")
         self.custom_espanso_dir = self.settings.value("espanso_dir", "")
+        # Read on first use and then kept in sync by _show_package_warning
+        self.package_warning_enabled: Optional[bool] = None
     
     def _initialize_data_structures(self) -> None:
         """Initialize all data structures used by the application."""
@@ -93,18 +128,36 @@ class EZpanso(QMainWindow):
         self.files_data: FileData = {}  # file_path -> list of match dicts
         self.file_paths: List[str] = []  # ordered list of file paths
         self.display_name_to_path: Dict[str, str] = {}  # display name -> file path mapping
+        self.path_to_display_name: Dict[str, str] = {}  # file path -> display name (reverse lookup)
+        self.file_stamps: Dict[str, Tuple[int, int]] = {}  # file path -> (mtime in ns, size) when last loaded or saved
+        self.file_documents: Dict[str, Dict[str, Any]] = {}  # file path -> full parsed document (other keys, comments)
         self.active_file_path: Optional[str] = None
+        self.table_file_path: Optional[str] = None  # File whose matches the table currently shows
         self.is_modified = False
         self.modified_files: set = set()  # Track which files have been modified
         
+        # Trigger lookup: file_path -> {trigger: index into files_data[file_path]}
+        self.trigger_index: Dict[str, Dict[str, int]] = {}
+        self._indexed_matches: Dict[str, List[Dict[str, Any]]] = {}  # List each index was built from
+        
         # For sorting and filtering
         self.current_matches: List[Dict[str, Any]] = []  # Current file's matches (for compatibility)
         self.filtered_indices: List[int] = []  # Indices of visible rows
+        self._sort_column: Optional[int] = None  # Column picked from the header, if any
+        self._sort_order = Qt.SortOrder.AscendingOrder
+        self._filter_row_texts: Optional[List[Optional[str]]] = None  # Lowercased "trigger\nreplace" per row
+        self._last_filter_text: Optional[str] = None  # Filter last applied to the cached rows
+        self._hidden_rows: set = set()  # Rows hidden by the last filter
         
         # Undo/Redo system
-        self.undo_stack: List[Dict[str, Any]] = []  # Stack of undo states
-        self.redo_stack: List[Dict[str, Any]] = []  # Stack of redo states
+        self.undo_stack: List[Dict[str, Any]] = []  # Stack of change records to undo
+        self.redo_stack: List[Dict[str, Any]] = []  # Stack of undone change records to redo
         self.max_undo_steps = MAX_UNDO_STEPS  # Maximum number of undo steps to keep
+        # Each file's state is the id of its last applied change record (None: as loaded); a file
+        # differs from disk exactly when its state is not the one it had when last saved
+        self._change_count = 0
+        self._file_states: Dict[str, Optional[int]] = {}
+        self._saved_file_states: Dict[str, Optional[int]] = {}
     
     def _initialize_ui(self) -> None:
         """Initialize the user interface components."""
@@ -133,27 +186,18 @@ class EZpanso(QMainWindow):
             return str(value)
         
         # Strip outer quotes if they match (for editing convenience)
-        display_value = value
-        if len(display_value) >= 2:
-            if (display_value.startswith('"') and display_value.endswith('"')) or \
-               (display_value.startswith("'") and display_value.endswith("'")):
-                display_value = display_value[1:-1]
+        if len(value) >= 2 and value[0] == value[-1] and value[0] in ('"', "'"):
+            value = value[1:-1]
         
-        # First escape literal backslashes, then convert actual newlines/tabs to escape sequences
-        display_value = display_value.replace('\\', '\\\\')  # Escape literal backslashes first
-        display_value = display_value.replace('\n', '\\n').replace('\t', '\\t')
-        return display_value
+        # Escape literal backslashes and convert actual newlines/tabs in a single pass
+        return value.translate(DISPLAY_ESCAPES)
     
     def _process_escape_sequences(self, value: str) -> str:
         """Convert escape sequences like \\n and \\t to actual characters."""
         if not isinstance(value, str):
             return str(value)
-        # Convert escape sequences to actual characters
-        # Handle literal backslashes first to avoid double processing
-        processed_value = value.replace('\\\\', '\x00')  # Temporary placeholder
-        processed_value = processed_value.replace('\\n', '\n').replace('\\t', '\t')
-        processed_value = processed_value.replace('\x00', '\\')  # Restore literal backslashes
-        return processed_value
+        # Single left-to-right scan, so an escaped backslash is never reread as part of \\n or \\t
+        return ESCAPE_SEQUENCE_PATTERN.sub(lambda m: ESCAPE_SEQUENCES[m.group()], value)
         
     def _setup_ui(self):
         """Simple UI setup."""
@@ -167,20 +211,21 @@ class EZpanso(QMainWindow):
         self.filter_box = QLineEdit()
         self.filter_box.setPlaceholderText("Filter...")
         self.filter_box.setStyleSheet(INPUT_STYLE)
-        self.filter_box.textChanged.connect(self._apply_filter)
+        # Filter once typing pauses instead of on every keystroke; each keystroke restarts the timer
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(FILTER_DELAY_MS)
+        self._filter_timer.timeout.connect(self._apply_filter)
+        self.filter_box.textChanged.connect(lambda _text: self._filter_timer.start())
         file_layout.addWidget(self.filter_box, 1)  # 25% proportion
         
         self.file_selector = QComboBox()
+        # Back the combo box with a string list model so it can be repopulated in one reset
+        self.file_selector.setModel(QStringListModel(self.file_selector))
         self.file_selector.currentTextChanged.connect(self._on_file_selected)
         file_layout.addWidget(self.file_selector, 2)  # 50% proportion
         
-        # Get platform-specific shortcut string for Open button
-        if sys.platform == 'darwin':  # macOS
-            open_key = "⌘O"
-        else:  # Windows/Linux/Unix
-            open_key = "Ctrl+O"
-        
-        open_btn = QPushButton(f"Open ({open_key})")
+        open_btn = QPushButton(f"Open ({SHORTCUT_LABELS['open']})")
         open_btn.setStyleSheet(BUTTON_STYLE)
         open_btn.clicked.connect(self._open_current_file)
         file_layout.addWidget(open_btn, 1)  # 25% proportion
@@ -191,7 +236,8 @@ class EZpanso(QMainWindow):
         self.table = QTableWidget()
         self.table.setColumnCount(2)
         self.table.setHorizontalHeaderLabels(["Trigger", "Replace"])
-        self.table.setSortingEnabled(True)
+        # Qt's built-in sorting would re-sort on every edit; rows are sorted explicitly instead
+        self.table.setSortingEnabled(False)
         
         # Enable context menu
         self.table.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
@@ -207,6 +253,10 @@ class EZpanso(QMainWindow):
             header.setSectionResizeMode(0, QHeaderView.ResizeMode.Interactive)
             header.setSectionResizeMode(1, QHeaderView.ResizeMode.Stretch)
             self.table.setColumnWidth(0, 144)
+            header.setSectionsClickable(True)
+            header.setSortIndicatorShown(True)
+            header.setSortIndicator(-1, Qt.SortOrder.AscendingOrder)  # No column sort until clicked
+            header.sectionClicked.connect(self._sort_by_column)
         
         # Step 5: Enable in-place editing
         self.table.itemChanged.connect(self._on_item_changed)
@@ -216,38 +266,27 @@ class EZpanso(QMainWindow):
         # Setup keyboard shortcuts
         self._setup_shortcuts()
         
-        # Get platform-specific shortcut strings for button labels
-        if sys.platform == 'darwin':  # macOS
-            new_key = "⌘N"
-            save_key = "⌘S"
-            find_key = "⌘F"
-            refresh_key = "⌘R"
-        else:  # Windows/Linux/Unix
-            new_key = "Ctrl+N"
-            save_key = "Ctrl+S"
-            find_key = "Ctrl+F"
-            refresh_key = "F5"
-        
         # Update filter box placeholder with find shortcut
-        self.filter_box.setPlaceholderText(f"Find ({find_key})...")
+        self.filter_box.setPlaceholderText(f"Find ({SHORTCUT_LABELS['find']})...")
         
         # Bottom button layout: New, Refresh (left) and Save (right)
         bottom_btn_layout = QHBoxLayout()
         
-        new_btn = QPushButton(f"New match ({new_key})")
+        new_btn = QPushButton(f"New match ({SHORTCUT_LABELS['new']})")
         new_btn.setStyleSheet(BUTTON_STYLE)
         new_btn.clicked.connect(self._add_new_snippet)
         bottom_btn_layout.addWidget(new_btn)
         
-        refresh_btn = QPushButton(f"Refresh ({refresh_key})")
+        refresh_btn = QPushButton(f"Refresh ({SHORTCUT_LABELS['refresh']})")
         refresh_btn.setStyleSheet(BUTTON_STYLE)
         refresh_btn.clicked.connect(self._refresh_all_files)
         bottom_btn_layout.addWidget(refresh_btn)
         
         bottom_btn_layout.addStretch()
         
-        self.save_btn = QPushButton(f"Save ({save_key})")
+        self.save_btn = QPushButton(f"Save ({SHORTCUT_LABELS['save']})")
         self.save_btn.setStyleSheet(self.primary_button_style)
+        self._save_btn_has_changes: Optional[bool] = None  # Last state applied, to skip no-op updates
         self.save_btn.clicked.connect(self._save_all_with_confirmation)
         self._update_save_button_state()  # Set initial state
         bottom_btn_layout.addWidget(self.save_btn)
@@ -256,7 +295,7 @@ class EZpanso(QMainWindow):
         
         # If there are pending display names from early file loading, populate them now
         if hasattr(self, '_pending_display_names'):
-            self.file_selector.addItems(self._pending_display_names)
+            self._populate_file_selector(self._pending_display_names)
             if self._pending_display_names:
                 self._on_file_selected(self._pending_display_names[0])
             delattr(self, '_pending_display_names')
@@ -268,7 +307,7 @@ class EZpanso(QMainWindow):
             return
         
         # On macOS, use the application menu (first menu). On other platforms, create EZpanso menu.
-        if sys.platform == 'darwin':  # macOS
+        if IS_MACOS:
             # Get the application menu (automatically created by Qt)
             app_menu = None
             for action in menubar.actions():
@@ -286,7 +325,7 @@ class EZpanso(QMainWindow):
         
         if app_menu:
             # Add a separator before our custom items (on macOS this separates from default items)
-            if sys.platform == 'darwin':
+            if IS_MACOS:
                 app_menu.addSeparator()
             
             # Preferences action (includes About, Settings, and Links)
@@ -295,8 +334,8 @@ class EZpanso(QMainWindow):
                 preferences_action.setShortcut(QKeySequence.StandardKey.Preferences)
                 preferences_action.triggered.connect(self._show_preferences_dialog)
         
-    def _load_all_yaml_files(self):
-        """Step 1: safe_load all YAML files under match folder."""
+    def _get_espanso_dir(self) -> Optional[str]:
+        """Return the match folder to load, warning the user if none can be found."""
         # Use custom directory if set, otherwise auto-detect
         if self.custom_espanso_dir and os.path.isdir(self.custom_espanso_dir):
             espanso_dir = self.custom_espanso_dir
@@ -308,35 +347,88 @@ class EZpanso(QMainWindow):
         
         if not os.path.isdir(espanso_dir):
             self._show_warning("Missing Directory", "Could not find Espanso match directory.\nUse File > Set Folder to select one.")
+            return None
+        return espanso_dir
+    
+    def _load_all_yaml_files(self):
+        """Step 1: list all YAML files under match folder; each is parsed when first selected."""
+        espanso_dir = self._get_espanso_dir()
+        if not espanso_dir:
             return
             
-        # Walk through all files including subfolders
-        for root, dirs, files in os.walk(espanso_dir):
-            for filename in sorted(files):
-                # Skip files that start with "_"
-                if filename.startswith('_'):
-                    continue
-                    
-                if filename.endswith(('.yml', '.yaml')):
-                    file_path = os.path.join(root, filename)
-                    self._load_single_yaml_file(file_path)
+        # List all YAML files including subfolders; each one is parsed when it is first selected
+        self.file_paths[:] = self._find_yaml_files(espanso_dir)
         
-        # Create display names and populate file selector
-        display_names = []
-        for file_path in self.file_paths:
-            display_name = self._get_display_name(file_path)
-            display_names.append(display_name)
-            self.display_name_to_path[display_name] = file_path
+        display_names = self._build_display_names()
         
         # Populate file selector if it exists (UI has been set up)
         if hasattr(self, 'file_selector') and self.file_selector is not None:
-            self.file_selector.addItems(display_names)
-            if display_names:
-                self._on_file_selected(display_names[0])
+            self._populate_file_selector(display_names)
+            # Files without a matches list are dropped quietly until one loads
+            while self.file_selector.count():
+                file_path = self.display_name_to_path.get(self.file_selector.currentText())
+                if not file_path or self._load_or_drop_file(file_path):
+                    break
+            if self.file_selector.count():
+                self._on_file_selected(self.file_selector.currentText())
         else:
             # Store display names for later population if UI isn't ready yet
             self._pending_display_names = display_names
     
+    def _find_yaml_files(self, directory: str) -> List[str]:
+        """Return YAML files under a directory in os.walk order, skipping names starting with "_".
+        
+        Uses os.scandir so names are filtered before any path is built, and the file/directory
+        check comes from the directory listing instead of a separate stat per entry.
+        """
+        try:
+            with os.scandir(directory) as entries:
+                file_names, subdirs = [], []
+                for entry in entries:
+                    if entry.is_dir():
+                        if not entry.is_symlink():  # Like os.walk, do not descend into linked folders
+                            subdirs.append(entry.path)
+                    elif not entry.name.startswith('_') and entry.name.endswith(('.yml', '.yaml')):
+                        file_names.append(entry.name)
+        except OSError:
+            return []  # Unreadable folders are skipped, as os.walk does
+        
+        yaml_files = [os.path.join(directory, name) for name in sorted(file_names)]
+        for subdir in subdirs:
+            yaml_files.extend(self._find_yaml_files(subdir))
+        return yaml_files
+    
+    def _build_display_names(self) -> List[str]:
+        """Map every listed file to a unique display name, in file_paths order."""
+        self.display_name_to_path.clear()
+        self.path_to_display_name.clear()
+        # Unique names keep every file selectable
+        display_names = []
+        for file_path in self.file_paths:
+            display_name = self._get_display_name(file_path)
+            if display_name in self.display_name_to_path:
+                display_name = self._get_unique_display_name(display_name, file_path)
+            display_names.append(display_name)
+            self.display_name_to_path[display_name] = file_path
+            self.path_to_display_name[file_path] = display_name
+        return display_names
+    
+    def _populate_file_selector(self, display_names: List[str]) -> None:
+        """Replace the file selector entries with a single model reset instead of per-item inserts.
+        
+        Signals are blocked during the reset and the previous selection is kept if it still
+        exists, so callers decide explicitly when the table is repopulated.
+        """
+        current_display_name = self.file_selector.currentText()
+        self.file_selector.blockSignals(True)
+        try:
+            self.file_selector.model().setStringList(display_names)
+            if current_display_name:
+                # Only moves off the first entry if the previous selection is still listed
+                self.file_selector.setCurrentText(current_display_name)
+        finally:
+            self.file_selector.blockSignals(False)
+    
     def _get_display_name(self, file_path: str) -> str:
         """Get display name for a file, using parent folder name for package.yml files."""
         filename = os.path.basename(file_path)
@@ -346,13 +438,24 @@ class EZpanso(QMainWindow):
             return f"{parent_folder} (package)"
         return filename
     
+    def _get_unique_display_name(self, display_name: str, file_path: str) -> str:
+        """Qualify a display name already used by another file with the file's folder name."""
+        folder_name = os.path.basename(os.path.dirname(file_path))
+        unique_name = base_name = f"{display_name} [{folder_name}]"
+        counter = 2
+        while unique_name in self.display_name_to_path:
+            unique_name = f"{base_name} {counter}"
+            counter += 1
+        return unique_name
+    
     def _load_single_yaml_file(self, file_path: str):
         """Step 2: Load matches into dictionary per file with comment preservation.
         
-        This method is called both during initial loading and after saving to ensure
-        data consistency between memory and disk.
+        This method is called when a file is first selected.
         """
         try:
+            # Taken before parsing so a write during the load is picked up by the next refresh
+            stamp = self._get_file_stamp(file_path)
             yaml_content = self.yaml_handler.load(file_path) or {}
             
             # Skip files that don't contain a dictionary
@@ -362,6 +465,9 @@ class EZpanso(QMainWindow):
             matches = yaml_content.get('matches', [])
             if isinstance(matches, list):  # Load files with matches list (even if empty)
                 self.files_data[file_path] = matches
+                self.file_documents[file_path] = yaml_content
+                if stamp is not None:
+                    self.file_stamps[file_path] = stamp
                 # Only append to file_paths if not already present (avoid duplication)
                 if file_path not in self.file_paths:
                     self.file_paths.append(file_path)
@@ -369,18 +475,45 @@ class EZpanso(QMainWindow):
         except Exception as e:
             print(f"Error loading {file_path}: {e}")
     
+    def _get_file_stamp(self, file_path: str) -> Optional[Tuple[int, int]]:
+        """Return a file's (modification time in ns, size) to detect changes, or None if it cannot be read."""
+        try:
+            stat_result = os.stat(file_path)
+        except OSError:
+            return None
+        # The size also catches rewrites within the filesystem's timestamp resolution
+        return stat_result.st_mtime_ns, stat_result.st_size
+    
     def _on_file_selected(self, display_name: str):
         """Step 3: Populate table for chosen file."""
-        # Find file path from display name
-        self.active_file_path = self.display_name_to_path.get(display_name)
+        # Find file path from display name; it becomes active only once it is shown
+        file_path = self.display_name_to_path.get(display_name)
         
-        if not self.active_file_path:
+        if not file_path:
+            self.active_file_path = None
+            return
+        
+        # Re-selecting the file already on display needs no rebuild
+        if file_path == self.table_file_path:
+            self.active_file_path = file_path
             return
         
         # Show package warning if this is a package.yml file
         if "(package)" in display_name.lower():
             if not self._show_package_warning():
-                return  # User cancelled, don't proceed
+                self._restore_file_selection()  # User cancelled, keep the file on display
+                return
+        
+        # Files are parsed on first selection
+        if not self._load_or_drop_file(file_path):
+            self._show_warning("Unreadable File", f"{display_name} has no 'matches' list, so it was removed from the file list.")
+            if self.table_file_path or not self.file_selector.count():
+                self._restore_file_selection()
+            else:
+                self._on_file_selected(self.file_selector.currentText())  # Nothing shown yet: try the next file
+            return
+        
+        self.active_file_path = file_path
             
         # Clear filter when switching files
         if hasattr(self, 'filter_box'):
@@ -388,6 +521,41 @@ class EZpanso(QMainWindow):
             
         matches = self.files_data.get(self.active_file_path, [])
         self._populate_table(matches)
+        self.table_file_path = self.active_file_path
+    
+    def _load_or_drop_file(self, file_path: str) -> bool:
+        """Parse a file if needed; a file without a matches list is removed from the file list and selector."""
+        if file_path not in self.files_data:
+            self._load_single_yaml_file(file_path)
+        if file_path in self.files_data:
+            return True
+        
+        if file_path in self.file_paths:
+            self.file_paths.remove(file_path)
+        display_name = self.path_to_display_name.pop(file_path, None)
+        self.display_name_to_path.pop(display_name, None)
+        if hasattr(self, 'file_selector') and self.file_selector is not None:
+            index = self.file_selector.findText(display_name) if display_name else -1
+            if index >= 0:
+                signals_were_blocked = self.file_selector.blockSignals(True)
+                try:
+                    self.file_selector.removeItem(index)
+                finally:
+                    self.file_selector.blockSignals(signals_were_blocked)
+        return False
+    
+    def _restore_file_selection(self) -> None:
+        """Point the selector and active file back at the file the table shows, or at none."""
+        self.active_file_path = self.table_file_path
+        display_name = self.path_to_display_name.get(self.table_file_path) if self.table_file_path else None
+        if display_name:
+            signals_were_blocked = self.file_selector.blockSignals(True)
+            try:
+                self.file_selector.setCurrentText(display_name)
+            finally:
+                self.file_selector.blockSignals(signals_were_blocked)
+        elif hasattr(self, 'table'):
+            self.table.setRowCount(0)  # Rows of a file that is no longer loaded
     
     def _create_table_item(self, text: str, trigger_id: str, is_complex: bool = False) -> QTableWidgetItem:
         """Create a table item with consistent formatting and unique identifier."""
@@ -398,9 +566,8 @@ class EZpanso(QMainWindow):
         
         if is_complex:
             # Gray out complex matches and prevent editing
-            gray_brush = QBrush(QColor(180, 180, 180))
-            item.setBackground(gray_brush)
-            item.setFlags(item.flags() & ~Qt.ItemFlag.ItemIsEditable)
+            item.setBackground(self.COMPLEX_MATCH_BRUSH)
+            item.setFlags(self.COMPLEX_MATCH_FLAGS)
         
         return item
 
@@ -410,82 +577,163 @@ class EZpanso(QMainWindow):
         if not hasattr(self, 'table') or not self.table:
             return
             
-        # Sort: Editable entries first, then alphabetical by trigger
-        sorted_matches = self._sort_easy_match(matches)
+        # Sort: Editable entries first, then alphabetical by trigger (each match is classified once)
+        flagged_matches = self._sort_matches_with_flags(matches)
+        sorted_matches = [match for _, match in flagged_matches]
         
         # Store the sorted matches so table row indices correspond correctly
         self.current_matches = sorted_matches.copy()
         
+        # Suspend repaints and signals so the rows are written in one batch
+        self.table.setUpdatesEnabled(False)
         self.table.blockSignals(True)
-        self.table.setSortingEnabled(False)  # Disable during population
-        self.table.setRowCount(len(sorted_matches))
-        
-        for i, match in enumerate(sorted_matches):
-            trigger = str(match.get('trigger', ''))
-            replace = str(match.get('replace', ''))
-            
-            # Display unquoted values in UI for both trigger and replace
-            display_trigger = self._get_display_value(trigger)
-            display_replace = self._get_display_value(replace)
-            
-            # Step 4: Check if complex (more than trigger/replace)
-            is_complex = self._is_complex_match(match)
+        try:
+            self.table.setRowCount(len(sorted_matches))
             
-            # Create table items using helper method with trigger as unique ID
-            trigger_item = self._create_table_item(display_trigger, trigger, is_complex)
-            replace_item = self._create_table_item(display_replace, trigger, is_complex)
+            for i, (is_complex, match) in enumerate(flagged_matches):
+                trigger = str(match.get('trigger', ''))
+                replace = str(match.get('replace', ''))
+                
+                # Display unquoted values in UI for both trigger and replace
+                display_trigger = self._get_display_value(trigger)
+                display_replace = self._get_display_value(replace)
+                
+                # Create table items using helper method with trigger as unique ID
+                trigger_item = self._create_table_item(display_trigger, trigger, is_complex)
+                replace_item = self._create_table_item(display_replace, trigger, is_complex)
+                
+                self.table.setItem(i, 0, trigger_item)
+                self.table.setItem(i, 1, replace_item)
             
-            self.table.setItem(i, 0, trigger_item)
-            self.table.setItem(i, 1, replace_item)
-        
-        self.table.setSortingEnabled(True)  # Re-enable sorting
-        self.table.blockSignals(False)
+            # Keep a column order picked from the header, sorting once after all rows are set
+            if self._sort_column is not None:
+                self.table.sortItems(self._sort_column, self._sort_order)
+        finally:
+            self.table.blockSignals(False)
+            self.table.setUpdatesEnabled(True)
         
         # Initialize filter indices
+        self._invalidate_filter_cache()
         self.filtered_indices = list(range(len(sorted_matches)))
         self._apply_filter()
     
+    def _sort_by_column(self, column: int) -> None:
+        """Sort rows by a clicked header column, toggling the order on repeated clicks."""
+        if column == self._sort_column and self._sort_order == Qt.SortOrder.AscendingOrder:
+            self._sort_order = Qt.SortOrder.DescendingOrder
+        else:
+            self._sort_order = Qt.SortOrder.AscendingOrder
+        self._sort_column = column
+        self.table.horizontalHeader().setSortIndicator(column, self._sort_order)
+        self.table.sortItems(column, self._sort_order)
+        self._invalidate_filter_cache()  # Cached row texts follow the old row order
+        self._apply_filter()
+    
     def _is_complex_match(self, match: Dict[str, Any]) -> bool:
         """Step 4: Determine if match has more than trigger/replace."""
-        # Check for extra keys beyond trigger/replace
-        simple_keys = {'trigger', 'replace'}
-        extra_keys = set(match.keys()) - simple_keys
-        
-        # Consider complex if has extra keys or vars
-        return len(extra_keys) > 0 or 'vars' in match
+        # Complex if it has any key beyond trigger/replace (vars included); no set is built per call
+        return not SIMPLE_MATCH_KEYS.issuperset(match)
     
     def _sort_easy_match(self, matches: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Sort matches: editable entries first, then alphabetical by trigger."""
-        def sort_key(match):
-            is_complex = self._is_complex_match(match)
-            trigger = str(match.get('trigger', '')).lower()
-            # Return tuple: (is_complex, trigger) - False sorts before True
-            return (is_complex, trigger)
-        
-        return sorted(matches, key=sort_key)
+        return [match for _, match in self._sort_matches_with_flags(matches)]
+    
+    def _sort_matches_with_flags(self, matches: List[Dict[str, Any]]) -> List[Tuple[bool, Dict[str, Any]]]:
+        """Sort as _sort_easy_match does, returning (is_complex, match) pairs."""
+        # Step 4: Check if complex (more than trigger/replace), once per match
+        flagged_matches = [(self._is_complex_match(match), match) for match in matches]
+        # Key tuple: (is_complex, trigger) - False sorts before True
+        flagged_matches.sort(key=lambda item: (item[0], str(item[1].get('trigger', '')).lower()))
+        return flagged_matches
     
     def _apply_filter(self):
-        """Apply filter to table rows based on search text."""
+        """Apply filter to table rows based on search text.
+        
+        Row texts are lowercased once and cached. When the new filter extends the previous one
+        only visible rows are rechecked; when it shortens it only hidden rows are. An empty
+        filter just shows the hidden rows, without building the cache.
+        """
         if not hasattr(self, 'filter_box'):
             return
             
         filter_text = self.filter_box.text().lower()
+        last_filter_text = self._last_filter_text
+        if not filter_text:
+            self._show_hidden_rows()
+            self._last_filter_text = filter_text
+            return
+        
+        if self._filter_row_texts is None:
+            self._filter_row_texts = self._build_filter_row_texts()
+        row_texts = self._filter_row_texts
+        
+        if last_filter_text is None:
+            rows = range(len(row_texts))  # No known state: check every row
+            self._hidden_rows = set()  # Every row is set explicitly below
+        elif filter_text == last_filter_text:
+            return
+        elif filter_text.startswith(last_filter_text):
+            rows = [row for row in range(len(row_texts)) if row not in self._hidden_rows]
+        elif last_filter_text.startswith(filter_text):
+            rows = list(self._hidden_rows)
+        else:
+            rows = range(len(row_texts))
         
-        # Show/hide rows based on filter
+        # Show row if filter text is found in either trigger or replace; the view
+        # repaints once after the loop rather than for each hidden or shown row
+        updates_were_enabled = self.table.updatesEnabled()
+        self.table.setUpdatesEnabled(False)
+        try:
+            for row in rows:
+                row_text = row_texts[row]
+                if row_text is None:
+                    continue
+                hide_row = filter_text not in row_text
+                if last_filter_text is None or hide_row != (row in self._hidden_rows):
+                    self.table.setRowHidden(row, hide_row)
+                    if hide_row:
+                        self._hidden_rows.add(row)
+                    else:
+                        self._hidden_rows.discard(row)
+        finally:
+            self.table.setUpdatesEnabled(updates_were_enabled)
+        self._last_filter_text = filter_text
+    
+    def _show_hidden_rows(self) -> None:
+        """Unhide the rows the filter hid; all rows if they were added or moved since."""
+        if not self._hidden_rows:
+            return
+        # Row numbers are only known to be current while the cached filter state is valid
+        rows = self._hidden_rows if self._last_filter_text is not None else range(self.table.rowCount())
+        updates_were_enabled = self.table.updatesEnabled()
+        self.table.setUpdatesEnabled(False)
+        try:
+            for row in rows:
+                self.table.setRowHidden(row, False)
+        finally:
+            self.table.setUpdatesEnabled(updates_were_enabled)
+        self._hidden_rows = set()
+    
+    def _build_filter_row_texts(self) -> List[Optional[str]]:
+        """Lowercase each row's trigger and replace text once for filtering."""
+        row_texts: List[Optional[str]] = []
         for row in range(self.table.rowCount()):
             trigger_item = self.table.item(row, 0)
             replace_item = self.table.item(row, 1)
-            
             if trigger_item and replace_item:
-                trigger_text = trigger_item.text().lower()
-                replace_text = replace_item.text().lower()
-                
-                # Show row if filter text is found in either trigger or replace
-                show_row = (filter_text in trigger_text or 
-                           filter_text in replace_text or 
-                           filter_text == "")
-                
-                self.table.setRowHidden(row, not show_row)
+                # Displayed text never contains a real newline, so it safely separates the columns
+                row_texts.append(f"{trigger_item.text()}\n{replace_item.text()}".lower())
+            else:
+                row_texts.append(None)
+        return row_texts
+    
+    def _invalidate_filter_cache(self) -> None:
+        """Forget cached row texts after table contents or row order change.
+        
+        The hidden row set is kept so an empty filter knows whether any rows need showing.
+        """
+        self._filter_row_texts = None
+        self._last_filter_text = None
     
     def _focus_filter(self):
         """Focus the filter input field for Find shortcut."""
@@ -541,22 +789,25 @@ class EZpanso(QMainWindow):
             if reply != QMessageBox.StandardButton.Yes:
                 return False
         
-        # Save state before deletion
-        if len(triggers_to_delete) == 1:
-            display_trigger = self._get_display_value(triggers_to_delete[0])
-            self._save_state(f"Delete match: '{display_trigger}'")
-        else:
-            self._save_state(f"Delete {len(triggers_to_delete)} matches")
-
-        # Remove matches from files_data
+        # Remove matches from files_data in place, using a set for membership. Only the
+        # deleted positions are removed (back to front): a slice assignment on a ruamel
+        # CommentedSeq re-inserts every remaining item one at a time.
+        triggers_set = set(triggers_to_delete)
         matches = self.files_data[self.active_file_path]
-        remaining_matches = []
-        for match in matches:
-            trigger = str(match.get('trigger', ''))
-            if trigger not in triggers_to_delete:
-                remaining_matches.append(match)
-        
-        self.files_data[self.active_file_path] = remaining_matches
+        deleted_entries = [(index, match) for index, match in enumerate(matches)
+                           if str(match.get('trigger', '')) in triggers_set]
+        for index, _ in reversed(deleted_entries):
+            del matches[index]
+        self._invalidate_trigger_index(self.active_file_path)  # Indices shifted within the same list
+        
+        # Record the removed matches with their original positions for undo
+        if deleted_entries:
+            if len(triggers_to_delete) == 1:
+                display_trigger = self._get_display_value(triggers_to_delete[0])
+                description = f"Delete match: '{display_trigger}'"
+            else:
+                description = f"Delete {len(triggers_to_delete)} matches"
+            self._save_state(description, {'op': 'delete', 'entries': deleted_entries})
         
         # Clear table selection before refreshing to prevent TSM errors
         self.table.clearSelection()
@@ -606,6 +857,7 @@ class EZpanso(QMainWindow):
     
     def _on_item_changed(self, item: QTableWidgetItem):
         """Handle in-place editing using stored trigger ID for sorting-independent lookup."""
+        self._invalidate_filter_cache()  # The edited cell's cached row text is stale
         if not self.active_file_path:
             return
             
@@ -633,77 +885,155 @@ class EZpanso(QMainWindow):
         old_value = target_match.get(field_name, '')
         compare_value = self._process_escape_sequences(self._get_display_value(str(old_value)))
         
-        # Save state before making changes
-        if compare_value != new_value:  # Only save state if value actually changed
-            if col == 0:
-                self._save_state(f"Edit trigger: '{compare_value}' → '{new_value}'")
-            else:
-                trigger_display = self._get_display_value(trigger_id)
-                self._save_state(f"Edit replace: '{trigger_display}' content")
-        
         # Update the field using validation helper
         if self._validate_and_update_field(item, target_match, target_index, field_name, new_value, trigger_id):
-            # Mark as modified but skip table refresh to avoid disrupting in-place editing
-            self._mark_modified_and_refresh(skip_table_refresh=True)
+            # Record the edit for undo only if the value actually changed
+            if compare_value != new_value:
+                if col == 0:
+                    description = f"Edit trigger: '{compare_value}' → '{new_value}'"
+                else:
+                    description = f"Edit replace: '{self._get_display_value(trigger_id)}' content"
+                self._save_state(description, {'op': 'edit', 'index': target_index, 'field': field_name,
+                                               'old': old_value, 'new': target_match[field_name]})
+            
+            # The edited cell already shows the new value; only the modified state needs updating
+            self._mark_modified()
             
             # If we edited the trigger, update the stored trigger ID in both items of this row
             if col == 0 and new_value != trigger_id:
                 new_trigger_id = self._format_yaml_value(new_value)
-                # Update trigger ID in both cells of this row
+                # Update trigger ID in both cells of this row; this is item metadata only,
+                # so block itemChanged instead of re-running this handler for each cell
                 row = item.row()
                 trigger_item = self.table.item(row, 0)
                 replace_item = self.table.item(row, 1)
-                if trigger_item:
-                    trigger_item.setData(Qt.ItemDataRole.UserRole, new_trigger_id)
-                if replace_item:
-                    replace_item.setData(Qt.ItemDataRole.UserRole, new_trigger_id)
-        
+                signals_were_blocked = self.table.blockSignals(True)
+                try:
+                    if trigger_item:
+                        trigger_item.setData(Qt.ItemDataRole.UserRole, new_trigger_id)
+                    if replace_item:
+                        replace_item.setData(Qt.ItemDataRole.UserRole, new_trigger_id)
+                finally:
+                    self.table.blockSignals(signals_were_blocked)
+        
+    def _get_trigger_index(self, file_path: str) -> Dict[str, int]:
+        """Return the trigger -> index map for a file, rebuilding it if its matches list was replaced."""
+        matches = self.files_data.get(file_path, [])
+        if self._indexed_matches.get(file_path) is not matches:
+            index: Dict[str, int] = {}
+            for i, match in enumerate(matches):
+                index.setdefault(str(match.get('trigger', '')), i)  # First occurrence wins, like a linear scan
+            self.trigger_index[file_path] = index
+            self._indexed_matches[file_path] = matches
+        return self.trigger_index[file_path]
+    
+    def _invalidate_trigger_index(self, file_path: str) -> None:
+        """Force the trigger index to be rebuilt after a file's matches list is changed in place."""
+        self.trigger_index.pop(file_path, None)
+        self._indexed_matches.pop(file_path, None)
+    
     def _check_duplicate_trigger(self, new_trigger: str, exclude_index: int = -1) -> bool:
         """Check if a trigger already exists in the current file."""
         if not self.active_file_path:
             return False
         
-        matches = self.files_data[self.active_file_path]
-        for i, match in enumerate(matches):
-            if i != exclude_index and match.get('trigger') == new_trigger:
-                return True
-        return False
+        index = self._get_trigger_index(self.active_file_path).get(new_trigger, -1)
+        return index != -1 and index != exclude_index
     
     def _find_match_by_trigger(self, trigger: str):
         """Find a match by its trigger value. Returns (match, index) or (None, -1)."""
         if not self.active_file_path:
             return None, -1
         
-        matches = self.files_data[self.active_file_path]
-        for i, match in enumerate(matches):
-            stored_trigger = str(match.get('trigger', ''))
-            if stored_trigger == trigger:
-                return match, i
-        return None, -1
-
-    def _find_match_by_trigger_display(self, trigger_display: str):
-        """Find a match by its display trigger value. Returns (match, index) or (None, -1)."""
-        if not self.active_file_path:
+        index = self._get_trigger_index(self.active_file_path).get(trigger, -1)
+        if index == -1:
             return None, -1
-        
-        matches = self.files_data[self.active_file_path]
-        for i, match in enumerate(matches):
-            stored_trigger = str(match.get('trigger', ''))
-            display_trigger = self._get_display_value(stored_trigger)
-            if display_trigger == trigger_display:
-                return match, i
-        return None, -1
+        return self.files_data[self.active_file_path][index], index
 
-    def _mark_modified_and_refresh(self, skip_table_refresh: bool = False):
-        """Mark the file as modified and refresh the UI."""
+    def _mark_modified(self):
+        """Mark the active file as modified and update the title and save button (not the table)."""
         if self.active_file_path:
             self.modified_files.add(self.active_file_path)
         self.is_modified = True
         self._update_title()
         self._update_save_button_state()
+    
+    def _mark_modified_and_refresh(self, skip_table_refresh: bool = False):
+        """Mark the file as modified and refresh the UI."""
+        self._mark_modified()
         if self.active_file_path and not skip_table_refresh:
-            matches = self.files_data.get(self.active_file_path, [])
+            self._sync_table_rows()
+    
+    def _sync_table_rows(self) -> None:
+        """Bring the table in line with the active file after matches were added or deleted.
+        
+        Only rows of deleted matches are removed and rows for new matches inserted; all other
+        rows keep their items. Falls back to a full populate if the table shows another file,
+        or for new rows while a header sort is active (their place among ties would differ).
+        """
+        matches = self.files_data.get(self.active_file_path, [])
+        if self.table_file_path != self.active_file_path:
             self._populate_table(matches)
+            return
+        
+        live_triggers = {str(match.get('trigger', '')) for match in matches}
+        shown_triggers = set()
+        removed_rows = []
+        for row in range(self.table.rowCount()):
+            item = self.table.item(row, 0)
+            trigger = item.data(Qt.ItemDataRole.UserRole) if item else None
+            if trigger in live_triggers:
+                shown_triggers.add(trigger)
+            else:
+                removed_rows.append(row)
+        
+        # Remove each run of consecutive rows with one call, back to front so row numbers stay valid
+        end = len(removed_rows)
+        while end:
+            start = end - 1
+            while start and removed_rows[start - 1] == removed_rows[start] - 1:
+                start -= 1
+            self.table.model().removeRows(removed_rows[start], end - start)
+            end = start
+        self.current_matches = [match for match in self.current_matches
+                                if str(match.get('trigger', '')) in live_triggers]
+        
+        new_matches = [match for match in matches if str(match.get('trigger', '')) not in shown_triggers]
+        if new_matches and self._sort_column is not None:
+            self._populate_table(matches)
+            return
+        if new_matches:
+            self.table.blockSignals(True)
+            try:
+                # Each new row goes where a full populate would put it: editable first, then by trigger
+                for is_complex, match in self._sort_matches_with_flags(new_matches):
+                    trigger = str(match.get('trigger', ''))
+                    replace = str(match.get('replace', ''))
+                    row = self._find_insert_row(is_complex, trigger)
+                    self.table.insertRow(row)
+                    self.table.setItem(row, 0, self._create_table_item(self._get_display_value(trigger), trigger, is_complex))
+                    self.table.setItem(row, 1, self._create_table_item(self._get_display_value(replace), trigger, is_complex))
+                    self.current_matches.insert(row, match)
+            finally:
+                self.table.blockSignals(False)
+        
+        self._invalidate_filter_cache()  # Row numbers shifted
+        self._apply_filter()
+    
+    def _find_insert_row(self, is_complex: bool, trigger: str) -> int:
+        """Return the row where a match belongs in the editable-first, trigger-alphabetical order."""
+        key = (is_complex, trigger.lower())
+        low, high = 0, self.table.rowCount()
+        while low < high:
+            middle = (low + high) // 2
+            item = self.table.item(middle, 0)
+            row_key = (not (item.flags() & Qt.ItemFlag.ItemIsEditable),
+                       str(item.data(Qt.ItemDataRole.UserRole)).lower())
+            if key < row_key:
+                high = middle
+            else:
+                low = middle + 1
+        return low
 
     def _validate_and_update_field(self, item: QTableWidgetItem, target_match: Dict[str, Any], 
                                  target_index: int, field: str, new_value: str, current_trigger: str):
@@ -720,6 +1050,12 @@ class EZpanso(QMainWindow):
         
         # Format and store the value
         formatted_value = self._format_yaml_value(new_value)
+        if is_trigger:
+            trigger_index = self._get_trigger_index(self.active_file_path)
+            old_trigger = str(target_match.get('trigger', ''))
+            if trigger_index.get(old_trigger) == target_index:
+                del trigger_index[old_trigger]
+            trigger_index[str(formatted_value)] = target_index
         target_match[field] = formatted_value
         
         # Update display
@@ -749,10 +1085,13 @@ class EZpanso(QMainWindow):
     def _save_single_file(self, file_path: str, matches: List[Dict[str, Any]]) -> bool:
         """Save a single YAML file with comment preservation. Returns True if successful."""
         try:
-            # Read existing file to preserve other keys and comments
-            existing_content = {}
-            if os.path.exists(file_path):
-                existing_content = self.yaml_handler.load(file_path) or {}
+            # Reuse the document parsed at load time to preserve other keys and comments,
+            # reading the file again only if it changed on disk since then
+            existing_content = self.file_documents.get(file_path)
+            if existing_content is None or self.file_stamps.get(file_path) != self._get_file_stamp(file_path):
+                existing_content = {}
+                if os.path.exists(file_path):
+                    existing_content = self.yaml_handler.load(file_path) or {}
             
             # Update matches section
             existing_content['matches'] = matches
@@ -762,14 +1101,19 @@ class EZpanso(QMainWindow):
             if self.yaml_handler.save(existing_content, file_path):
                 save_successful = True
             else:
-                # Fallback to PyYAML if YAML handler fails
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    yaml.dump(existing_content, f, sort_keys=False, allow_unicode=True, default_style=None)
+                # Fallback to PyYAML if YAML handler fails: dumped in memory, then written atomically
+                yaml_text = yaml.dump(existing_content, Dumper=PYYAML_DUMPER, sort_keys=False,
+                                      allow_unicode=True, default_style=None)
+                write_text_atomic(file_path, yaml_text)
                 save_successful = True
             
-            # Reload the file to ensure our in-memory data matches what's on disk
+            # The in-memory matches are what was just written, so the file is not re-read
             if save_successful:
-                self._load_single_yaml_file(file_path)
+                # Recorded so the next refresh or save does not parse the file that was just written
+                self.file_documents[file_path] = existing_content
+                stamp = self._get_file_stamp(file_path)
+                if stamp is not None:
+                    self.file_stamps[file_path] = stamp
                 return True
             
             return False
@@ -780,17 +1124,19 @@ class EZpanso(QMainWindow):
 
     def _save_all_files(self):
         """Save only the modified YAML files."""
-        saved_count = 0
+        saved_files = set()
         failed_count = 0
         
-        # Only save files that have been modified
-        for file_path in self.modified_files.copy():  # Use copy to avoid modification during iteration
+        # Only save files that have been modified; the set is updated once after the loop
+        for file_path in self.modified_files:
             matches = self.files_data.get(file_path, [])
             if self._save_single_file(file_path, matches):
-                saved_count += 1
-                self.modified_files.discard(file_path)  # Remove from modified set after successful save
+                saved_files.add(file_path)
+                self._saved_file_states[file_path] = self._file_states.get(file_path)
             else:
                 failed_count += 1
+        self.modified_files -= saved_files  # Remove successfully saved files
+        saved_count = len(saved_files)
         
         # Update UI based on save results
         if saved_count > 0 or failed_count > 0:
@@ -799,8 +1145,7 @@ class EZpanso(QMainWindow):
                 self.is_modified = False
             self._update_title()
             self._update_save_button_state()
-            # Refresh the current view to reflect latest state
-            self._refresh_current_view()
+            # The table already shows the saved data, so it is not repopulated
             
             # Show appropriate message
             if failed_count == 0:
@@ -809,9 +1154,12 @@ class EZpanso(QMainWindow):
                 self._show_warning("Save Incomplete", f"Saved {saved_count} file(s), but {failed_count} file(s) failed to save.\nSee error messages for details.")
     
     def _update_title(self):
-        """Update window title with modification indicator."""
+        """Update window title with modification indicator, skipping unchanged titles."""
         base_title = f"EZpanso v{APP_VERSION}"
-        self.setWindowTitle(f"{base_title}{' *' if self.is_modified else ''}")
+        new_title = f"{base_title}{' *' if self.is_modified else ''}"
+        if new_title != self._window_title:
+            self.setWindowTitle(new_title)
+            self._window_title = new_title
     
     def _add_new_snippet(self):
         """Add a new snippet via dialog."""
@@ -819,6 +1167,57 @@ class EZpanso(QMainWindow):
             self._show_information("No File Selected", "Please select a file first.\nChoose a file from the dropdown menu.")
             return
         
+        # Reuse the dialog widgets (and their parsed stylesheets) across invocations
+        if self._new_snippet_dialog is None:
+            self._new_snippet_dialog = self._build_new_snippet_dialog()
+        dialog, trigger_input, replace_input = self._new_snippet_dialog
+        trigger_input.clear()
+        replace_input.clear()
+        trigger_input.setFocus()
+        
+        # Keep dialog open until validation passes or user cancels
+        while True:
+            # Show dialog
+            if dialog.exec() != QDialog.DialogCode.Accepted:
+                return  # User cancelled
+            
+            trigger = trigger_input.text().strip()
+            replace = replace_input.text().strip()
+            
+            # Validate input
+            if not trigger or not replace:
+                self._show_warning("Missing Input", "Both trigger and replace must be filled.\nPlease complete both fields.")
+                continue  # Show dialog again
+            
+            # Process escape sequences in both trigger and replace
+            trigger = self._process_escape_sequences(trigger)
+            replace = self._process_escape_sequences(replace)
+            
+            # Check for duplicates using helper method
+            if self._check_duplicate_trigger(trigger):
+                self._show_warning("Duplicate Trigger", f"Trigger '{trigger}' already exists.\nPlease choose a different trigger.")
+                continue  # Show dialog again
+            
+            # All validation passed, break out of loop
+            break
+        
+        # Format both trigger and replace values with proper YAML quoting for consistency
+        formatted_trigger = self._format_yaml_value(trigger)
+        formatted_replace = self._format_yaml_value(replace)
+        
+        # Add new snippet
+        new_snippet = {'trigger': formatted_trigger, 'replace': formatted_replace}
+        trigger_index = self._get_trigger_index(self.active_file_path)
+        self.files_data[self.active_file_path].append(new_snippet)
+        new_index = len(self.files_data[self.active_file_path]) - 1
+        trigger_index.setdefault(str(formatted_trigger), new_index)
+        self._save_state(f"Add snippet: '{trigger}'", {'op': 'add', 'entries': [(new_index, new_snippet)]})
+        
+        # Mark as modified and refresh
+        self._mark_modified_and_refresh()
+
+    def _build_new_snippet_dialog(self) -> Tuple[QDialog, QLineEdit, QLineEdit]:
+        """Build the New Match dialog once. Returns (dialog, trigger_input, replace_input)."""
         # Simple input dialog with clean styling
         dialog = QDialog(self)
         dialog.setWindowTitle("New Match")
@@ -881,55 +1280,27 @@ class EZpanso(QMainWindow):
         
         layout.addLayout(button_layout)
         
-        trigger_input.setFocus()
-        
-        # Keep dialog open until validation passes or user cancels
-        while True:
-            # Show dialog
-            if dialog.exec() != QDialog.DialogCode.Accepted:
-                return  # User cancelled
-            
-            trigger = trigger_input.text().strip()
-            replace = replace_input.text().strip()
-            
-            # Validate input
-            if not trigger or not replace:
-                self._show_warning("Missing Input", "Both trigger and replace must be filled.\nPlease complete both fields.")
-                continue  # Show dialog again
-            
-            # Process escape sequences in both trigger and replace
-            trigger = self._process_escape_sequences(trigger)
-            replace = self._process_escape_sequences(replace)
-            
-            # Check for duplicates using helper method
-            if self._check_duplicate_trigger(trigger):
-                self._show_warning("Duplicate Trigger", f"Trigger '{trigger}' already exists.\nPlease choose a different trigger.")
-                continue  # Show dialog again
-            
-            # All validation passed, break out of loop
-            break
-        
-        # Save state before adding new snippet
-        self._save_state(f"Add snippet: '{trigger}'")
-        
-        # Format both trigger and replace values with proper YAML quoting for consistency
-        formatted_trigger = self._format_yaml_value(trigger)
-        formatted_replace = self._format_yaml_value(replace)
-        
-        # Add new snippet
-        new_snippet = {'trigger': formatted_trigger, 'replace': formatted_replace}
-        self.files_data[self.active_file_path].append(new_snippet)
-        
-        # Mark as modified and refresh
-        self._mark_modified_and_refresh()
+        return dialog, trigger_input, replace_input
 
-    def _save_state(self, description: str):
-        """Save current state to undo stack for operation tracking."""
+    def _save_state(self, description: str, change: Dict[str, Any]):
+        """Push a reversible change record for the active file onto the undo stack.
+        
+        Records hold only what changed ('edit': index, field, old and new value; 'add'/'delete':
+        (index, match) entries), plus an id and the file's state from before the change. Call this
+        after the change is applied and before the file is marked modified.
+        """
         if not self.active_file_path:
             return
-            
-        # Create state snapshot and add to undo stack
-        self.undo_stack.append(self._create_state(description))
+        
+        self._change_count += 1
+        change.update({
+            'description': description,
+            'file_path': self.active_file_path,
+            'id': self._change_count,
+            'previous_state': self._file_states.get(self.active_file_path)
+        })
+        self._file_states[self.active_file_path] = change['id']
+        self.undo_stack.append(change)
         
         # Limit stack size
         if len(self.undo_stack) > self.max_undo_steps:
@@ -938,38 +1309,43 @@ class EZpanso(QMainWindow):
         # Clear redo stack when new action is performed
         self.redo_stack.clear()
     
-    def _create_state(self, description: str) -> Dict[str, Any]:
-        """Create a state snapshot for undo/redo operations."""
-        if not self.active_file_path:
-            return {}
-        return {
-            'description': description,
-            'file_path': self.active_file_path,
-            'matches': [match.copy() for match in self.files_data[self.active_file_path]],
-            'is_modified': self.is_modified,
-            'modified_files': self.modified_files.copy()
-        }
-    
-    def _restore_state(self, state: Dict[str, Any]):
-        """Restore application state from a state snapshot."""
+    def _apply_change(self, change: Dict[str, Any], undo: bool):
+        """Apply a change record backwards (undo) or forwards (redo) and update the file's modified state."""
         # Switch to the file if needed
-        if state['file_path'] != self.active_file_path:
-            self._switch_to_file(state['file_path'])
-        
-        # Restore the data
-        self.files_data[state['file_path']] = [match.copy() for match in state['matches']]
-        self.is_modified = state['is_modified']
-        self.modified_files = state.get('modified_files', set()).copy()
+        if change['file_path'] != self.active_file_path:
+            self._switch_to_file(change['file_path'])
+        
+        matches = self.files_data[change['file_path']]
+        if change['op'] == 'edit':
+            matches[change['index']][change['field']] = change['old'] if undo else change['new']
+        elif (change['op'] == 'add') == undo:
+            # Undoing an add or redoing a delete: remove from the back so earlier indices stay valid
+            for index, _ in reversed(change['entries']):
+                del matches[index]
+        else:
+            # Undoing a delete or redoing an add: entries are in ascending original order
+            for index, match in change['entries']:
+                matches.insert(index, match)
+        self._invalidate_trigger_index(change['file_path'])
+        
+        # The file is unmodified only if this step returns it to the state it was saved (or loaded) in
+        file_path = change['file_path']
+        state = change['previous_state'] if undo else change['id']
+        self._file_states[file_path] = state
+        if state == self._saved_file_states.get(file_path):
+            self.modified_files.discard(file_path)
+        else:
+            self.modified_files.add(file_path)
+        self.is_modified = bool(self.modified_files)
         
         # Refresh UI
         self._refresh_current_view()
     
     def _switch_to_file(self, file_path: str):
         """Switch to a specific file by finding its display name."""
-        for display_name, path in self.display_name_to_path.items():
-            if path == file_path:
-                self.file_selector.setCurrentText(display_name)
-                break
+        display_name = self.path_to_display_name.get(file_path)
+        if display_name:
+            self.file_selector.setCurrentText(display_name)
     
     def _refresh_current_view(self):
         """Refresh the current UI view."""
@@ -979,36 +1355,49 @@ class EZpanso(QMainWindow):
             self._populate_table(self.files_data[self.active_file_path])
     
     def _refresh_all_files(self):
-        """Reload all YAML files from disk and refresh the UI."""
-        # Save current file selection
-        current_display_name = self.file_selector.currentText() if hasattr(self, 'file_selector') else None
+        """Reload YAML files from disk and refresh the UI.
         
-        # Clear all data
-        self.files_data.clear()
-        self.file_paths.clear()
-        self.display_name_to_path.clear()
-        
-        # Clear UI
-        if hasattr(self, 'file_selector'):
-            self.file_selector.clear()
-        if hasattr(self, 'table'):
-            self.table.setRowCount(0)
+        Files changed on disk and files with unsaved edits are dropped and parsed again when
+        next selected; unchanged files keep the matches already in memory.
+        """
+        espanso_dir = self._get_espanso_dir()
+        found_paths = self._find_yaml_files(espanso_dir) if espanso_dir else []
+        
+        # Forget parsed files that are gone or changed on disk; edits are discarded, so
+        # modified files are dropped as well
+        found_set = set(found_paths)
+        for file_path in list(self.files_data):
+            if (file_path in found_set and file_path not in self.modified_files
+                    and self.file_stamps.get(file_path) == self._get_file_stamp(file_path)):
+                continue
+            del self.files_data[file_path]
+            self.file_stamps.pop(file_path, None)
+            self.file_documents.pop(file_path, None)
+            self._invalidate_trigger_index(file_path)
+        self.file_paths[:] = found_paths
+        
+        self.undo_stack.clear()  # Change records index into the lists being replaced
+        self.redo_stack.clear()
+        self._file_states.clear()
+        self._saved_file_states.clear()
         
         # Reset modification state since we're reloading from disk
         self.is_modified = False
         self.modified_files.clear()
-        self.active_file_path = None
         
-        # Reload all files
-        self._load_all_yaml_files()
-        
-        # Restore file selection if possible
-        if current_display_name and hasattr(self, 'file_selector'):
-            index = self.file_selector.findText(current_display_name)
-            if index >= 0:
-                self.file_selector.setCurrentIndex(index)
-            elif self.file_selector.count() > 0:
-                self.file_selector.setCurrentIndex(0)
+        display_names = self._build_display_names()
+        if hasattr(self, 'file_selector') and self.file_selector is not None:
+            # The selector keeps its selection and is only reset if the list of files changed
+            if display_names != self.file_selector.model().stringList():
+                self._populate_file_selector(display_names)
+            if self.table_file_path not in self.files_data:
+                self.table_file_path = None  # The table shows matches that were dropped
+            if display_names:
+                self._on_file_selected(self.file_selector.currentText())
+            else:
+                self.active_file_path = None
+                self.table_file_path = None
+                self.table.setRowCount(0)
         
         # Update UI state
         self._update_title()
@@ -1019,30 +1408,18 @@ class EZpanso(QMainWindow):
         if not self.undo_stack:
             return
         
-        # Save current state to redo stack before undoing
-        if self.active_file_path:
-            state = self._create_state('redo_point')
-            if state:  # Only add if valid state was created
-                self.redo_stack.append(state)
-        
-        # Restore previous state
-        state = self.undo_stack.pop()
-        self._restore_state(state)
+        change = self.undo_stack.pop()
+        self._apply_change(change, undo=True)
+        self.redo_stack.append(change)
 
     def _redo(self):
         """Redo the last undone operation."""
         if not self.redo_stack:
             return
         
-        # Save current state to undo stack before redoing
-        if self.active_file_path:
-            state = self._create_state('undo_point')
-            if state:  # Only add if valid state was created
-                self.undo_stack.append(state)
-        
-        # Restore redo state
-        state = self.redo_stack.pop()
-        self._restore_state(state)
+        change = self.redo_stack.pop()
+        self._apply_change(change, undo=False)
+        self.undo_stack.append(change)
     
     def _create_message_box(self, icon_type, title, text, buttons=QMessageBox.StandardButton.Ok):
         """Create a message box with consistent styling and no icons."""
@@ -1120,6 +1497,16 @@ class EZpanso(QMainWindow):
             
     def _show_preferences_dialog(self):
         """Show the Preferences dialog with About, Settings, and Links in one view."""
+        # Reuse the dialog widgets (and their parsed stylesheets) across invocations
+        if self._preferences_dialog is None:
+            self._preferences_dialog = self._build_preferences_dialog()
+        dialog, folder_input = self._preferences_dialog
+        folder_input.setText(self.custom_espanso_dir or "")
+        
+        dialog.exec()
+    
+    def _build_preferences_dialog(self) -> Tuple[QDialog, QLineEdit]:
+        """Build the Preferences dialog once. Returns (dialog, folder_input)."""
         dialog = QDialog(self)
         dialog.setWindowTitle("Preferences")
         dialog.setModal(True)
@@ -1202,7 +1589,7 @@ class EZpanso(QMainWindow):
         
         layout.addLayout(button_layout)
         
-        dialog.exec()
+        return dialog, current_folder_input
     
     def _change_folder_from_preferences(self, parent_dialog, folder_input):
         """Change folder from within preferences dialog."""
@@ -1223,11 +1610,21 @@ class EZpanso(QMainWindow):
             self.files_data.clear()
             self.file_paths.clear()
             self.display_name_to_path.clear()
+            self.path_to_display_name.clear()
+            self.file_stamps.clear()
+            self.file_documents.clear()
+            self.trigger_index.clear()
+            self._indexed_matches.clear()
+            self.undo_stack.clear()  # Change records index into the lists being replaced
+            self.redo_stack.clear()
+            self._file_states.clear()
+            self._saved_file_states.clear()
             self.active_file_path = None
             self.is_modified = False
             self.modified_files.clear()
             self.file_selector.clear()
             self.table.setRowCount(0)
+            self.table_file_path = None
             
             self._load_all_yaml_files()
             self._update_save_button_state()
@@ -1236,8 +1633,9 @@ class EZpanso(QMainWindow):
     def _show_package_warning(self) -> bool:
         """Show warning dialog for package.yml files. Returns True if user wants to proceed."""
         # Check if user has opted out of this warning
-        show_warning = self.settings.value("show_package_warning", True, type=bool)
-        if not show_warning:
+        if self.package_warning_enabled is None:
+            self.package_warning_enabled = self.settings.value("show_package_warning", True, type=bool)
+        if not self.package_warning_enabled:
             return True
         
         # Create custom dialog
@@ -1303,6 +1701,7 @@ class EZpanso(QMainWindow):
         # Save preference if user checked "do not show again"
         if self.dont_show_checkbox.isChecked():
             self.settings.setValue("show_package_warning", False)
+            self.package_warning_enabled = False
         
         return result == QDialog.DialogCode.Accepted
 
@@ -1327,6 +1726,10 @@ class EZpanso(QMainWindow):
         """Update save button enabled/disabled state based on unsaved changes."""
         if hasattr(self, 'save_btn'):
             has_changes = self.is_modified and bool(self.modified_files)
+            # Restyling re-parses the stylesheet, so only touch the button when the state changes
+            if has_changes == self._save_btn_has_changes:
+                return
+            self._save_btn_has_changes = has_changes
             self.save_btn.setEnabled(has_changes)
             
             # Update button style to show grayed out state
@@ -1358,13 +1761,11 @@ class EZpanso(QMainWindow):
             return True
         else:  # Cancel
             # Revert the combo box selection
-            if self.active_file_path:
-                for display_name, path in self.display_name_to_path.items():
-                    if path == self.active_file_path:
-                        self.file_selector.blockSignals(True)
-                        self.file_selector.setCurrentText(display_name)
-                        self.file_selector.blockSignals(False)
-                        break
+            display_name = self.path_to_display_name.get(self.active_file_path) if self.active_file_path else None
+            if display_name:
+                self.file_selector.blockSignals(True)
+                self.file_selector.setCurrentText(display_name)
+                self.file_selector.blockSignals(False)
             return False
     
 def main():
@@ -1380,7 +1781,7 @@ def main():
     app.setApplicationVersion(APP_VERSION)
     
     # Set application icon globally
-    icon_path = os.path.join(os.path.dirname(__file__), 'icon_512x512.png')
+    icon_path = os.path.join(os.path.dirname(__file__), ICON_FILENAME)
     if os.path.exists(icon_path):
         app.setWindowIcon(QIcon(icon_path))
     
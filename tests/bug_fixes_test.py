@@ -171,8 +171,8 @@ class TestInPlaceEditingFixes:
             for i, match in enumerate(sorted_matches):
                 assert ezpanso.current_matches[i] == match
     
-    def test_find_match_by_trigger_display(self):
-        """Test finding matches by their display trigger value."""
+    def test_find_match_by_trigger(self):
+        """Test finding matches by the stored trigger value kept in the table items."""
         app = QApplication.instance() or QApplication(sys.argv)
         
         with patch.object(EZpanso, '_setup_ui'), \
@@ -190,9 +190,8 @@ class TestInPlaceEditingFixes:
             
             # Test finding match with newlines
             trigger_with_newlines = ':test\nwith\nnewlines'
-            display_trigger = ezpanso._get_display_value(trigger_with_newlines)
             
-            match, index = ezpanso._find_match_by_trigger_display(display_trigger)
+            match, index = ezpanso._find_match_by_trigger(trigger_with_newlines)
             
             assert match is not None
             assert match['trigger'] == trigger_with_newlines
@@ -200,16 +199,15 @@ class TestInPlaceEditingFixes:
             
             # Test finding simple match
             simple_trigger = ':simple'
-            simple_display = ezpanso._get_display_value(simple_trigger)
             
-            match, index = ezpanso._find_match_by_trigger_display(simple_display)
+            match, index = ezpanso._find_match_by_trigger(simple_trigger)
             
             assert match is not None
             assert match['trigger'] == simple_trigger
             assert index == 1
             
             # Test non-existent match
-            match, index = ezpanso._find_match_by_trigger_display('nonexistent')
+            match, index = ezpanso._find_match_by_trigger('nonexistent')
             
             assert match is None
             assert index == -1
@@ -240,6 +238,31 @@ class TestInPlaceEditingFixes:
             assert not ezpanso._check_duplicate_trigger(':test1', exclude_index=0)  # Should not find (excluded)
             assert ezpanso._check_duplicate_trigger(':test1', exclude_index=1)      # Should find (not excluded)
 
+    
+    def test_trigger_edit_does_not_reenter_item_changed(self):
+        """Test that updating a row's trigger IDs after a trigger edit does not re-run the edit handler."""
+        app = QApplication.instance() or QApplication(sys.argv)
+        
+        with patch.object(EZpanso, '_load_all_yaml_files'), \
+             patch.object(EZpanso, '_on_item_changed', autospec=True,
+                          side_effect=EZpanso._on_item_changed) as mock_on_item_changed:
+            
+            ezpanso = EZpanso()
+            
+            ezpanso.active_file_path = '/test/file.yml'
+            test_matches = [
+                {'trigger': ':test1', 'replace': 'value1'},
+                {'trigger': ':test2', 'replace': 'value2'}
+            ]
+            ezpanso.files_data = {'/test/file.yml': test_matches}
+            ezpanso._populate_table(test_matches)
+            
+            ezpanso.table.item(0, 0).setText(':renamed')
+            
+            assert mock_on_item_changed.call_count == 1
+            assert test_matches[0]['trigger'] == ':renamed'
+            assert ezpanso.table.item(0, 0).data(Qt.ItemDataRole.UserRole) == ':renamed'
+            assert ezpanso.table.item(0, 1).data(Qt.ItemDataRole.UserRole) == ':renamed'
 
 @pytest.mark.skipif(not PYQT_AVAILABLE, reason="PyQt6 not available")
 class TestRealFileHandling:
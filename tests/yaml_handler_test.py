@@ -55,6 +55,67 @@ class TestYAMLHandler:
         assert handler.backend == "PyYAML"
         assert not handler.supports_comments
     
+    @pytest.mark.skipif(not YAML_HANDLER_AVAILABLE, reason="yaml_handler not available")
+    def test_pyyaml_backend_round_trip(self):
+        """Test the PyYAML backend (C loader/dumper when libyaml is present) round-trips matches."""
+        handler = create_yaml_handler(preserve_comments=False)
+        data = {'matches': [{'trigger': ':tab', 'replace': 'a\tb\nc'}, {'trigger': ':ü', 'replace': 'ünïcode'}]}
+        
+        dumped = handler.dump_to_string(data)
+        assert dumped is not None
+        assert 'ünïcode' in dumped  # allow_unicode is honoured
+        assert dumped.index('trigger') < dumped.index('replace')  # key order kept
+        assert handler.load_from_string(dumped) == data
+    
+    @pytest.mark.skipif(not YAML_HANDLER_AVAILABLE, reason="yaml_handler not available")
+    def test_save_skips_unchanged_content(self):
+        """Test that saving identical content leaves the file (and its mtime) untouched."""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.yml', delete=False) as tf:
+            tf.write('# comment\nmatches:\n  - trigger: ":a"\n    replace: "a"\n')
+            temp_path = tf.name
+
+        try:
+            handler = create_yaml_handler(preserve_comments=True)
+            data = handler.load(temp_path)
+            assert handler.save(data, temp_path)
+            os.utime(temp_path, ns=(0, 0))
+
+            assert handler.save(data, temp_path)
+            assert os.stat(temp_path).st_mtime_ns == 0
+
+            data['matches'][0]['replace'] = 'b'
+            assert handler.save(data, temp_path)
+            assert os.stat(temp_path).st_mtime_ns != 0
+            assert handler.load(temp_path)['matches'][0]['replace'] == 'b'
+        finally:
+            if os.path.exists(temp_path):
+                os.unlink(temp_path)
+
+    @pytest.mark.skipif(not YAML_HANDLER_AVAILABLE, reason="yaml_handler not available")
+    @pytest.mark.skipif(sys.platform == 'win32', reason="symlinks and file modes are POSIX-specific")
+    def test_save_is_atomic_and_keeps_symlinks(self):
+        """Test that saving replaces the link target in one step and keeps the link, mode and other files."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            target_path = os.path.join(temp_dir, 'target.yml')
+            link_path = os.path.join(temp_dir, 'link.yml')
+            with open(target_path, 'w', encoding='utf-8') as f:
+                f.write('matches: []\n')
+            os.chmod(target_path, 0o600)
+            os.symlink(target_path, link_path)
+            with open(target_path + '.tmp', 'w', encoding='utf-8') as f:
+                f.write('user file')
+
+            handler = create_yaml_handler(preserve_comments=True)
+            assert handler.save({'matches': [{'trigger': ':a', 'replace': 'a'}]}, link_path)
+
+            assert os.path.islink(link_path)
+            assert os.stat(target_path).st_mode & 0o777 == 0o600
+            assert handler.load(target_path)['matches'][0]['trigger'] == ':a'
+            # No temporary file left, and a user file with the '.tmp' name is untouched
+            assert sorted(os.listdir(temp_dir)) == ['link.yml', 'target.yml', 'target.yml.tmp']
+            with open(target_path + '.tmp', encoding='utf-8') as f:
+                assert f.read() == 'user file'
+
     @pytest.mark.skipif(not YAML_HANDLER_AVAILABLE, reason="yaml_handler not available")
     def test_load_save_cycle(self):
         """Test loading and saving YAML with comment preservation."""
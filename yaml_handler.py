@@ -10,6 +10,9 @@ The handler automatically falls back to PyYAML if ruamel.yaml is not available.
 
 from typing import Dict, Any, Optional
 import io
+import os
+import shutil
+import tempfile
 
 # Try to import ruamel.yaml, fall back to PyYAML
 try:
@@ -20,6 +23,55 @@ except ImportError:
 
 import yaml
 
+# Prefer libyaml's C implementation for the PyYAML backend when PyYAML was built with it
+LIBYAML_AVAILABLE = getattr(yaml, '__with_libyaml__', False)
+PYYAML_LOADER = yaml.CSafeLoader if LIBYAML_AVAILABLE else yaml.SafeLoader
+PYYAML_DUMPER = yaml.CSafeDumper if LIBYAML_AVAILABLE else yaml.SafeDumper
+
+
+def _read_text(file_path: str) -> Optional[str]:
+    """Return a file's text, or None if it does not exist or cannot be read."""
+    try:
+        with open(file_path, 'r', encoding='utf-8') as f:
+            return f.read()
+    except (OSError, UnicodeDecodeError):
+        return None
+
+
+def write_text_atomic(file_path: str, text: str) -> None:
+    """
+    Write text to a temporary file beside the target and move it into place.
+    
+    A failed write never leaves the target truncated. Symlinks are followed
+    and the target's permissions are kept.
+    
+    Args:
+        file_path: Path of the file to write
+        text: Complete file content
+    """
+    if os.path.islink(file_path):
+        file_path = os.path.realpath(file_path)
+    # A unique hidden name, so no user file is overwritten and concurrent saves do not collide
+    fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(file_path),
+                                     prefix='.' + os.path.basename(file_path), suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write(text)
+        if os.path.exists(file_path):
+            shutil.copymode(file_path, temp_path)
+        else:
+            # mkstemp creates the file as 0600; give a new file the usual default permissions
+            umask = os.umask(0)
+            os.umask(umask)
+            os.chmod(temp_path, 0o666 & ~umask)
+        os.replace(temp_path, file_path)
+    except Exception:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+        raise
+
 
 class YAMLHandler:
     """
@@ -63,7 +115,7 @@ class YAMLHandler:
                 if self.preserve_comments:
                     return self.ruamel_yaml.load(f)
                 else:
-                    return yaml.safe_load(f)
+                    return yaml.load(f, Loader=PYYAML_LOADER)
         except Exception as e:
             print(f"Error loading YAML file {file_path}: {e}")
             return None
@@ -72,6 +124,10 @@ class YAMLHandler:
         """
         Save YAML to file with comment preservation if possible.
         
+        The file is written atomically and left untouched if its content would
+        not change, so its modification time (and Espanso's file watcher) is
+        not triggered.
+        
         Args:
             data: Data to save
             file_path: Path to save the file
@@ -80,11 +136,10 @@ class YAMLHandler:
             True if successful, False otherwise
         """
         try:
-            with open(file_path, 'w', encoding='utf-8') as f:
-                if self.preserve_comments:
-                    self.ruamel_yaml.dump(data, f)
-                else:
-                    yaml.dump(data, f, sort_keys=False, allow_unicode=True, default_style=None)
+            yaml_string = self._dump(data)
+            if _read_text(file_path) == yaml_string:
+                return True
+            write_text_atomic(file_path, yaml_string)
             return True
         except Exception as e:
             print(f"Error saving YAML file {file_path}: {e}")
@@ -104,7 +159,7 @@ class YAMLHandler:
             if self.preserve_comments:
                 return self.ruamel_yaml.load(io.StringIO(yaml_string))
             else:
-                return yaml.safe_load(yaml_string)
+                return yaml.load(yaml_string, Loader=PYYAML_LOADER)
         except Exception as e:
             print(f"Error parsing YAML string: {e}")
             return None
@@ -120,16 +175,20 @@ class YAMLHandler:
             YAML string or None on error
         """
         try:
-            if self.preserve_comments:
-                stream = io.StringIO()
-                self.ruamel_yaml.dump(data, stream)
-                return stream.getvalue()
-            else:
-                return yaml.dump(data, sort_keys=False, allow_unicode=True, default_style=None)
+            return self._dump(data)
         except Exception as e:
             print(f"Error dumping YAML to string: {e}")
             return None
     
+    def _dump(self, data: Dict[str, Any]) -> str:
+        """Serialize data with the active backend, raising on error."""
+        if self.preserve_comments:
+            stream = io.StringIO()
+            self.ruamel_yaml.dump(data, stream)
+            return stream.getvalue()
+        return yaml.dump(data, Dumper=PYYAML_DUMPER, sort_keys=False,
+                         allow_unicode=True, default_style=None)
+    
     @property
     def supports_comments(self) -> bool:
         """Check if comment preservation is supported."""